@@ -0,0 +1 @@
+# Keeps the repository root on sys.path so plain `pytest` can import the services package
@@ -8,7 +8,7 @@ from tkinter import filedialog
 from tkinter import simpledialog
 import queue
 from services.csv_service import CSVService
-import json
+from services.vector_storage_service import STORAGE_MODES
     
 class PineconeUtility:
     def __init__(self, master):
@@ -28,6 +28,11 @@ class PineconeUtility:
         self.csv_service = CSVService(logger=self.logger)
         self.pinecone_service = PineconeService(logger=self.logger)
 
+    def apply_storage_mode(self):
+        mode = self.storage_mode_var.get()
+        self.csv_service.vector_storage.set_mode(mode)
+        self.pinecone_service.vector_storage.set_mode(mode)
+
     def setup_window(self):
         self.master.title("Pinecone Utility GUI")
         self.master.geometry("850x600")
@@ -60,6 +65,7 @@ class PineconeUtility:
 
     def process_csv_file_thread(self):
         try:
+            self.apply_storage_mode()
             CSV_FILE = self.csv_file_path.get()
             df = self.csv_service.read_csv_file(CSV_FILE)
 
@@ -73,8 +79,7 @@ class PineconeUtility:
 
             vectors = self.csv_service.create_vectors(df, main_column, metadata_columns)
 
-            json_output = {"vectors": vectors}
-            self.csv_service.save_json_to_file(json_output, "output.json")
+            self.csv_service.save_vectors_to_file(vectors, "output.json")
 
             self.log_queue.put("Processing completed successfully")
         except Exception as e:
@@ -149,8 +154,17 @@ class PineconeUtility:
         self.browse_button = self.create_button(
             self.csv_frame, "Browse", self.browse_file, 2, 1
         )
+
+        self.create_label(self.csv_frame, "Vector Storage:", 3, 0)
+        self.storage_mode_var = tk.StringVar(self.master, value=STORAGE_MODES[0])
+        self.storage_mode_dropdown = self.create_dropdown(
+            self.csv_frame, self.storage_mode_var, 3, 1
+        )
+        self.storage_mode_dropdown["values"] = STORAGE_MODES
+        self.storage_mode_dropdown["state"] = "readonly"
+
         self.process_button = self.create_button(
-            self.csv_frame, "Process CSV", self.process_csv_file, 3, 0, columnspan=2
+            self.csv_frame, "Process CSV", self.process_csv_file, 4, 0, columnspan=2
         )
 
     def create_pinecone_section(self):
@@ -229,7 +243,7 @@ class PineconeUtility:
             index_name = self.index_name_var.get()
             pinecone_api_key = self.PINECONE_API_KEY
             # Assuming init_pinecone is a method of PineconeService that initializes the service
-            self.pinecone_service.init_pinecone(index_name)
+            self.pinecone_service.init_pinecone(index_name, namespace)
             self.log_queue.put("Pinecone initialized successfully.")
         except Exception as e:
             self.log_queue.put(
@@ -249,6 +263,7 @@ class PineconeUtility:
     def fetch_all_from_pinecone_thread(self):
         try:
             self.log_queue.put("Starting Pinecone fetch all...")
+            self.apply_storage_mode()
             all_data = self.pinecone_service.fetch_all_vectors_and_metadata()
             self.log_queue.put(
                 f"Fetched all data from Pinecone. Total records: {len(all_data)}"
@@ -327,10 +342,7 @@ class PineconeUtility:
                 self.log_queue.put("No JSON file selected for upload.")
                 return
 
-            with open(json_file_path, "r") as json_file:
-                data = json.load(json_file)
-
-            vectors = data.get("vectors", [])
+            vectors = self.pinecone_service.vector_storage.load_vectors(json_file_path)
             if not vectors:
                 self.log_queue.put("No vectors found in the JSON file.")
                 return
@@ -343,20 +355,6 @@ class PineconeUtility:
         except Exception as e:
             self.log_queue.put(f"An error occurred during upload to Pinecone: {str(e)}")
 
-    def fetch_all_from_pinecone(self):
-        fetch_all_thread = threading.Thread(target=self.fetch_all_from_pinecone_thread)
-        fetch_all_thread.start()
-
-    def fetch_all_from_pinecone_thread(self):
-        try:
-            # Assuming fetch_all_vectors is a method in PineconeService that fetches all vectors
-            all_vectors = self.pinecone_service.fetch_all_vectors()
-            self.log_queue.put(f"Fetched {len(all_vectors)} vectors from Pinecone.")
-        except Exception as e:
-            self.log_queue.put(
-                f"An error occurred during fetching from Pinecone: {str(e)}"
-            )
-
     def browse_json_file(self):
         try:
             file_path = filedialog.askopenfilename(
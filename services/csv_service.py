@@ -4,6 +4,7 @@ import tiktoken
 import logging
 import pandas as pd
 from openai import OpenAI
+from services.vector_storage_service import VectorStorageService
 
 class CSVService:
     def __init__(self, logger=None):
@@ -15,6 +16,7 @@ class CSVService:
         self.logger = logger
         self.selected_columns = []
         self.max_embedded_tokens = 2000
+        self.vector_storage = VectorStorageService(logger=logger)
 
     def setup_logging(self):
         if self.logger:
@@ -65,6 +67,7 @@ class CSVService:
 
     def create_vectors(self, df, main_content_column=None, metadata_columns=None):
         vectors = []
+        self.vector_storage.reset_stats()
         self.logger.info("Creating vectors...")
         for index, row in df.iterrows():
             content = str(row[main_content_column])
@@ -91,7 +94,11 @@ class CSVService:
             # Build metadata dictionary from all selected metadata columns
             metadata = {column: str(row[column]) for column in metadata_columns}
 
-            vectors.append({"id": str(index), "values": response, "metadata": metadata})
+            vector = {"id": str(index), "values": response, "metadata": metadata}
+            if self.vector_storage.is_compact():
+                vector["values"], vector["scale"] = self.vector_storage.compress(response)
+
+            vectors.append(vector)
             self.logger.info(f"Created new JSON object for index {index}")
 
         return vectors
@@ -104,6 +111,13 @@ class CSVService:
         except Exception as e:
             self.logger.error(f"Failed to save JSON file at {file_path}: {e}")
 
+    def save_vectors_to_file(self, vectors, file_path):
+        try:
+            self.vector_storage.save_vectors(vectors, file_path)
+            self.logger.info(f"Vectors saved successfully at {file_path} ({self.vector_storage.mode})")
+        except Exception as e:
+            self.logger.error(f"Failed to save vectors at {file_path}: {e}")
+
     def main(self):
         self.setup_logging()
 
@@ -113,12 +127,10 @@ class CSVService:
 
         vectors = self.create_vectors(df, self.main_content_column)
 
-        json_output = {"vectors": vectors}
-
         print("Writing JSON to file...")
-        self.save_json_to_file(json_output, "output.json")
+        self.save_vectors_to_file(vectors, "output.json")
 
         backup_path = "backup_output.json"
         if not os.path.exists("output.json"):
             self.logger.warning("Attempting to save JSON to backup location...")
-            self.save_json_to_file(json_output, backup_path)
+            self.save_vectors_to_file(vectors, backup_path)
@@ -2,6 +2,7 @@ import csv
 import json
 import os
 from pinecone import Pinecone, ServerlessSpec
+from services.vector_storage_service import VectorStorageService
 
 class PineconeService:
     def __init__(self, logger=None):
@@ -9,15 +10,18 @@ class PineconeService:
         self.logger = logger
         self.pc = None
         self.index = None
+        self.namespace = ""
         self.initialized = False
+        self.vector_storage = VectorStorageService(logger=logger)
 
-    def init_pinecone(self, index_name):
+    def init_pinecone(self, index_name, namespace=""):
         if self.initialized:
             self.logger.info("Pinecone is already initialized. Reinitializing...")
         try:
             self.logger.info("Initializing Pinecone...")
             self.pc = Pinecone(api_key=self.api_key)
             self.index = self.pc.Index(index_name)
+            self.namespace = namespace
             stats = self.index.describe_index_stats()
             if stats:
                 self.logger.info(f"Pinecone initialized successfully. Stats: {stats}")
@@ -31,16 +35,18 @@ class PineconeService:
     def upsert_vectors(self, vectors):
         try:
             self.logger.info(f"Found {len(vectors)} vectors in the JSON file.")
-            # Transform vectors into the correct format
-            formatted_vectors = [(vec["id"], vec["values"], vec.get("metadata", {})) for vec in vectors]
-
             # Batch vectors in sets of 100
             self.logger.info("Batching vectors...")
-            vector_batches = [formatted_vectors[i:i + 100] for i in range(0, len(formatted_vectors), 100)]
-
-            for i, batch in enumerate(vector_batches):
+            vector_batches = [vectors[i:i + 100] for i in range(0, len(vectors), 100)]
+
+            for i, vector_batch in enumerate(vector_batches):
+                # Transform vectors into the correct format, dequantizing compact values per batch
+                batch = [
+                    (vec["id"], self.vector_storage.dequantize(vec["values"], vec.get("scale")), vec.get("metadata", {}))
+                    for vec in vector_batch
+                ]
                 self.logger.info(f"Upserting batch {i + 1}...")
-                self.index.upsert(vectors=batch)  # Make sure this matches your Pinecone SDK's method signature
+                self.index.upsert(vectors=batch, namespace=self.namespace)  # Make sure this matches your Pinecone SDK's method signature
 
             self.logger.info("Vectors successfully upserted to Pinecone.")
         except Exception as e:
@@ -67,7 +73,7 @@ class PineconeService:
             # Fetch vectors and metadata
             for id_batch in batch(all_ids, batch_size):
                 self.logger.info(f"Fetching batch {id_batch} of size {batch_size}...")
-                fetch_response = self.index.fetch(ids=id_batch)
+                fetch_response = self.index.fetch(ids=id_batch, namespace=self.namespace)
 
                 if fetch_response is None:
                     self.logger.warning(f"No data returned for batch {id_batch}.")
@@ -90,27 +96,46 @@ class PineconeService:
 
     def save_to_csv(self, data):
         try:
+            compact = self.vector_storage.is_compact()
+            self.vector_storage.reset_stats()
+            compressed = []
+
             with open("pinecone_data.csv", mode="w", newline="") as file:
                 writer = csv.writer(file)
-                writer.writerow(["ID", "Values", "Metadata"])
+                # In compact mode values go to .npy sidecars and the CSV keeps the row index
+                writer.writerow(["ID", "Row" if compact else "Values", "Metadata"])
 
                 for d in data:
                     id_ = d.get("id", "")
                     values = d.get("values", [])
                     metadata = d.get("metadata", {})
 
-                    writer.writerow(
-                        [id_, ",".join(map(str, values)), json.dumps(metadata)]
-                    )
-
-            print("Data saved to CSV file successfully.")
+                    if compact:
+                        # Sidecar rows must all share one dimension, so skip records that don't fit
+                        dimension = len(compressed[0]["values"]) if compressed else len(values)
+                        if not values or len(values) != dimension:
+                            self.logger.warning(f"Skipping vector {id_}: no values or dimension mismatch")
+                            continue
+                        stored, scale = self.vector_storage.compress(values)
+                        writer.writerow([id_, len(compressed), json.dumps(metadata)])
+                        compressed.append({"values": stored, "scale": scale})
+                    else:
+                        writer.writerow(
+                            [id_, ",".join(map(str, values)), json.dumps(metadata)]
+                        )
+
+            if compact:
+                _, written = self.vector_storage.write_arrays(compressed, "pinecone_data.csv")
+                self.vector_storage.report(written, separator=",")
+
+            self.logger.info("Data saved to CSV file successfully.")
         except Exception as e:
-            print(f"An error occurred while saving to CSV: {str(e)}")
+            self.logger.error(f"An error occurred while saving to CSV: {str(e)}")
 
     def delete_vectors(self, ids):
         try:
             self.logger.info(f"Deleting vectors with IDs: {ids}...")
-            self.index.delete(ids=ids)
+            self.index.delete(ids=ids, namespace=self.namespace)
             self.logger.info("Vectors successfully deleted.")
         except Exception as e:
             self.logger.error(f"An error occurred during Pinecone delete: {str(e)}")
@@ -119,7 +144,7 @@ class PineconeService:
     def update_vector(self, id, values, metadata=None):
         try:
             self.logger.info(f"Updating vector with ID: {id}...")
-            self.index.upsert(vectors=[(id, values, metadata or {})])
+            self.index.upsert(vectors=[(id, values, metadata or {})], namespace=self.namespace)
             self.logger.info("Vector successfully updated.")
         except Exception as e:
             self.logger.error(f"An error occurred during Pinecone update: {str(e)}")
@@ -0,0 +1,187 @@
+import json
+import os
+import numpy as np
+
+STORAGE_MODES = ["float32", "float16", "int8"]
+
+
+class VectorStorageService:
+    def __init__(self, logger=None, mode="float32"):
+        self.logger = logger
+        self.set_mode(mode)
+        self.reset_stats()
+
+    def set_mode(self, mode):
+        if mode not in STORAGE_MODES:
+            raise ValueError(f"Unknown vector storage mode '{mode}'. Expected one of {STORAGE_MODES}")
+        self.mode = mode
+
+    def is_compact(self):
+        return self.mode != "float32"
+
+    def reset_stats(self):
+        self.stats = {
+            "count": 0,
+            "float32_bytes": 0,
+            "compact_bytes": 0,
+            "value_count": 0,
+            "chars_per_value": None,
+            "cosine_error_sum": 0.0,
+            "cosine_error_max": 0.0,
+        }
+
+    def compress(self, values):
+        # Returns (stored_values, scale); scale is None unless mode is int8
+        original = np.asarray(values, dtype=np.float32)
+        if self.mode == "float16":
+            stored, scale = original.astype(np.float16), None
+        elif self.mode == "int8":
+            peak = float(np.abs(original).max()) if original.size else 0.0
+            scale = peak / 127.0 if peak > 0 else 1.0
+            stored = np.clip(np.rint(original / scale), -127, 127).astype(np.int8)
+        else:
+            stored, scale = original, None
+
+        self._record(original, stored, scale)
+        return stored, scale
+
+    def dequantize(self, values, scale=None):
+        if isinstance(values, list):
+            return values
+        restored = np.asarray(values, dtype=np.float32)
+        if scale is not None:
+            restored = restored * np.float32(scale)
+        return restored.tolist()
+
+    def _record(self, original, stored, scale):
+        restored = stored.astype(np.float32)
+        if scale is not None:
+            restored = restored * np.float32(scale)
+        norms = float(np.linalg.norm(original)) * float(np.linalg.norm(restored))
+        cosine = float(np.dot(original, restored)) / norms if norms > 0 else 1.0
+        error = max(0.0, 1.0 - cosine)
+
+        self.stats["count"] += 1
+        self.stats["float32_bytes"] += original.nbytes
+        self.stats["compact_bytes"] += stored.nbytes + (4 if scale is not None else 0)
+        self.stats["value_count"] += original.size
+        if self.stats["chars_per_value"] is None and original.size:
+            # Sample the float32 text width once instead of encoding every vector
+            self.stats["chars_per_value"] = sum(len(repr(float(v))) for v in original) / original.size
+        self.stats["cosine_error_sum"] += error
+        self.stats["cosine_error_max"] = max(self.stats["cosine_error_max"], error)
+
+    def sidecar_paths(self, file_path):
+        base = os.path.splitext(file_path)[0]
+        return f"{base}.values.npy", f"{base}.scales.npy"
+
+    def write_arrays(self, vectors, file_path):
+        # Stacks compressed vectors into .npy sidecars; returns the storage header and the paths written
+        values_path, scales_path = self.sidecar_paths(file_path)
+        dtype = np.float16 if self.mode == "float16" else np.int8
+        if vectors:
+            matrix = np.stack([np.asarray(vec["values"], dtype=dtype) for vec in vectors])
+        else:
+            matrix = np.zeros((0, 0), dtype=dtype)
+        np.save(values_path, matrix)
+        written = [values_path]
+
+        storage = {"dtype": self.mode, "values_file": os.path.basename(values_path)}
+        if self.mode == "int8":
+            scales = np.array([vec["scale"] for vec in vectors], dtype=np.float32)
+            np.save(scales_path, scales)
+            storage["scales_file"] = os.path.basename(scales_path)
+            written.append(scales_path)
+        return storage, written
+
+    def save_vectors(self, vectors, file_path):
+        if not self.is_compact():
+            with open(file_path, "w") as json_file:
+                json.dump({"vectors": vectors}, json_file)
+            return
+
+        storage, written = self.write_arrays(vectors, file_path)
+        records = [{"id": vec["id"], "metadata": vec.get("metadata", {})} for vec in vectors]
+        with open(file_path, "w") as json_file:
+            json.dump({"storage": storage, "vectors": records}, json_file)
+
+        self.report(written)
+
+    def load_vectors(self, file_path):
+        with open(file_path, "r") as json_file:
+            data = json.load(json_file)
+
+        vectors = data.get("vectors", [])
+        storage = data.get("storage")
+        if not storage:
+            return vectors
+
+        # Memory-map the sidecars; rows are only dequantized when batches are built for upsert
+        directory = os.path.dirname(file_path)
+        matrix = np.load(os.path.join(directory, storage["values_file"]), mmap_mode="r")
+        scales = None
+        if storage.get("scales_file"):
+            scales = np.load(os.path.join(directory, storage["scales_file"]), mmap_mode="r")
+
+        if len(matrix) != len(vectors):
+            raise Exception(
+                f"Vector storage mismatch: {len(vectors)} records but {len(matrix)} stored vectors"
+            )
+
+        for i, vec in enumerate(vectors):
+            vec["values"] = matrix[i]
+            vec["scale"] = float(scales[i]) if scales is not None else None
+
+        if self.logger:
+            self.logger.info(f"Memory-mapped {len(vectors)} {storage['dtype']} vectors from {file_path}")
+        return vectors
+
+    def report(self, written_paths=None, separator=", "):
+        # Disk figures compare vector values only: estimated float32 text (as the float32
+        # JSON/CSV would write them, joined by separator) against the .npy sidecars written
+        stats = self.stats
+        count = stats["count"]
+        chars_per_value = stats["chars_per_value"] or 0
+        report = {
+            "mode": self.mode,
+            "count": count,
+            "float32_memory_bytes": stats["float32_bytes"],
+            "compact_memory_bytes": stats["compact_bytes"],
+            "float32_text_bytes": int(stats["value_count"] * (chars_per_value + len(separator))),
+            "sidecar_disk_bytes": None,
+            "mean_cosine_error": stats["cosine_error_sum"] / count if count else 0.0,
+            "max_cosine_error": stats["cosine_error_max"],
+        }
+
+        if written_paths:
+            report["sidecar_disk_bytes"] = sum(os.path.getsize(p) for p in written_paths)
+
+        if self.logger:
+            self.logger.info(
+                f"Vector storage report ({self.mode}, {count} vectors): "
+                f"memory {self._format_bytes(report['float32_memory_bytes'])} float32 -> "
+                f"{self._format_bytes(report['compact_memory_bytes'])}"
+                f"{self._format_savings(report['float32_memory_bytes'], report['compact_memory_bytes'])}"
+            )
+            if report["sidecar_disk_bytes"] is not None:
+                self.logger.info(
+                    f"Vector values on disk: ~{self._format_bytes(report['float32_text_bytes'])} as float32 text (estimated) -> "
+                    f"{self._format_bytes(report['sidecar_disk_bytes'])} in .npy sidecars"
+                    f"{self._format_savings(report['float32_text_bytes'], report['sidecar_disk_bytes'])}"
+                )
+            self.logger.info(
+                f"Cosine similarity error vs float32: mean {report['mean_cosine_error']:.2e}, "
+                f"max {report['max_cosine_error']:.2e}"
+            )
+        return report
+
+    def _format_bytes(self, size):
+        for unit in ["B", "KB", "MB", "GB"]:
+            if size < 1024 or unit == "GB":
+                return f"{size:.1f} {unit}"
+            size /= 1024
+
+    def _format_savings(self, before, after):
+        if not before:
+            return ""
+        return f" ({100 * (1 - after / before):.1f}% saved)"
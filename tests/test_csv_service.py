@@ -0,0 +1,70 @@
+import json
+import logging
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("openai")
+pytest.importorskip("tiktoken")
+
+from services import csv_service
+from services.csv_service import CSVService
+
+
+class FakeEmbeddings:
+    def create(self, input, model):
+        values = [float(len(input)), 1.0, -0.5, 0.25]
+        data = type("Embedding", (), {"embedding": values})()
+        return type("Response", (), {"data": [data]})()
+
+
+class FakeOpenAI:
+    def __init__(self):
+        self.embeddings = FakeEmbeddings()
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(csv_service.tiktoken, "encoding_for_model", lambda model: None)
+    monkeypatch.setattr(csv_service, "OpenAI", FakeOpenAI)
+    return CSVService(logger=logging.getLogger(__name__))
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"text": ["alpha", "be", "gamma ray"], "tag": ["x", "y", "z"]})
+
+
+@pytest.mark.parametrize("mode", ["float16", "int8"])
+def test_create_vectors_compact(tmp_path, service, df, mode):
+    service.vector_storage.set_mode(mode)
+
+    vectors = service.create_vectors(df, "text", ["tag"])
+
+    assert [vec["id"] for vec in vectors] == ["0", "1", "2"]
+    assert all(isinstance(vec["values"], np.ndarray) for vec in vectors)
+    assert vectors[0]["values"].dtype == (np.float16 if mode == "float16" else np.int8)
+    assert service.vector_storage.report()["count"] == 3
+
+    file_path = str(tmp_path / "output.json")
+    service.save_vectors_to_file(vectors, file_path)
+
+    with open(file_path) as json_file:
+        data = json.load(json_file)
+    assert data["storage"]["dtype"] == mode
+    assert data["vectors"][2] == {"id": "2", "metadata": {"tag": "z"}}
+
+    loaded = service.vector_storage.load_vectors(file_path)
+    restored = service.vector_storage.dequantize(loaded[2]["values"], loaded[2]["scale"])
+    assert np.allclose(restored, [9.0, 1.0, -0.5, 0.25], atol=0.05)
+
+
+def test_create_vectors_float32(tmp_path, service, df):
+    vectors = service.create_vectors(df, "text", ["tag"])
+    file_path = str(tmp_path / "output.json")
+    service.save_vectors_to_file(vectors, file_path)
+
+    with open(file_path) as json_file:
+        data = json.load(json_file)
+    assert "storage" not in data
+    assert data["vectors"][1] == {"id": "1", "values": [2.0, 1.0, -0.5, 0.25], "metadata": {"tag": "y"}}
@@ -0,0 +1,104 @@
+import csv
+import logging
+import numpy as np
+import pytest
+
+pytest.importorskip("pinecone")
+
+from services.pinecone_service import PineconeService
+
+
+class FakeIndex:
+    def __init__(self):
+        self.upserts = []
+
+    def upsert(self, vectors, namespace=""):
+        self.upserts.append((vectors, namespace))
+
+
+def make_service(mode="float32", namespace=""):
+    service = PineconeService(logger=logging.getLogger(__name__))
+    service.index = FakeIndex()
+    service.namespace = namespace
+    service.vector_storage.set_mode(mode)
+    return service
+
+
+@pytest.mark.parametrize("mode", ["float16", "int8"])
+def test_upsert_dequantizes_each_batch(tmp_path, mode):
+    rng = np.random.default_rng(0)
+    raw = [rng.normal(size=16).tolist() for _ in range(250)]
+    service = make_service(mode, namespace="docs")
+    storage = service.vector_storage
+
+    vectors = []
+    for i, values in enumerate(raw):
+        stored, scale = storage.compress(values)
+        vectors.append({"id": str(i), "values": stored, "scale": scale, "metadata": {"i": str(i)}})
+    file_path = str(tmp_path / "output.json")
+    storage.save_vectors(vectors, file_path)
+
+    service.upsert_vectors(storage.load_vectors(file_path))
+
+    assert [len(batch) for batch, _ in service.index.upserts] == [100, 100, 50]
+    assert {namespace for _, namespace in service.index.upserts} == {"docs"}
+    upserted = [item for batch, _ in service.index.upserts for item in batch]
+    assert [item[0] for item in upserted] == [str(i) for i in range(250)]
+    assert upserted[7][2] == {"i": "7"}
+    for original, (_, values, _) in zip(raw, upserted):
+        assert isinstance(values, list) and isinstance(values[0], float)
+        assert np.allclose(values, original, atol=0.05)
+
+
+def test_upsert_passes_float32_lists_through():
+    service = make_service()
+    service.upsert_vectors([{"id": "a", "values": [0.1, 0.2]}])
+
+    assert service.index.upserts == [([("a", [0.1, 0.2], {})], "")]
+
+
+def read_csv_rows():
+    with open("pinecone_data.csv", newline="") as file:
+        return list(csv.reader(file))
+
+
+@pytest.mark.parametrize("mode", ["float16", "int8"])
+def test_save_to_csv_compact(tmp_path, monkeypatch, mode):
+    monkeypatch.chdir(tmp_path)
+    service = make_service(mode)
+    data = [
+        {"id": "a", "values": [1.0, 2.0, 3.0], "metadata": {"k": "a"}},
+        {"id": "empty", "values": [], "metadata": {}},
+        {"id": "b", "values": [4.0, 5.0, 6.0], "metadata": {"k": "b"}},
+        {"id": "short", "values": [1.0, 2.0], "metadata": {}},
+        {"id": "missing", "metadata": {}},
+        {"id": "c", "values": [-1.0, 0.0, 1.0], "metadata": {"k": "c"}},
+    ]
+
+    service.save_to_csv(data)
+
+    rows = read_csv_rows()
+    assert rows[0] == ["ID", "Row", "Metadata"]
+    assert [row[:2] for row in rows[1:]] == [["a", "0"], ["b", "1"], ["c", "2"]]
+
+    matrix = np.load(tmp_path / "pinecone_data.values.npy")
+    assert matrix.shape == (3, 3)
+    assert matrix.dtype == (np.float16 if mode == "float16" else np.int8)
+    scales_path = tmp_path / "pinecone_data.scales.npy"
+    if mode == "int8":
+        scales = np.load(scales_path)
+        restored = [service.vector_storage.dequantize(row, scale) for row, scale in zip(matrix, scales)]
+    else:
+        assert not scales_path.exists()
+        restored = [service.vector_storage.dequantize(row) for row in matrix]
+    assert np.allclose(restored[1], [4.0, 5.0, 6.0], atol=0.05)
+
+
+def test_save_to_csv_float32_keeps_inline_values(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    service = make_service()
+
+    service.save_to_csv([{"id": "a", "values": [0.5, 1.5], "metadata": {"k": "a"}}])
+
+    assert read_csv_rows() == [["ID", "Values", "Metadata"], ["a", "0.5,1.5", '{"k": "a"}']]
+    assert not (tmp_path / "pinecone_data.values.npy").exists()
@@ -0,0 +1,102 @@
+import logging
+import os
+import numpy as np
+import pytest
+from services.vector_storage_service import STORAGE_MODES, VectorStorageService
+
+TOLERANCES = {"float32": 1e-7, "float16": 1e-5, "int8": 1e-3}
+
+
+def make_vectors(storage, raw):
+    vectors = []
+    for i, values in enumerate(raw):
+        vector = {"id": str(i), "values": values, "metadata": {"row": str(i)}}
+        if storage.is_compact():
+            vector["values"], vector["scale"] = storage.compress(values)
+        vectors.append(vector)
+    return vectors
+
+
+def cosine(a, b):
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+@pytest.mark.parametrize("mode", STORAGE_MODES)
+def test_round_trip(tmp_path, mode):
+    rng = np.random.default_rng(0)
+    raw = [rng.normal(size=1536).tolist() for _ in range(20)]
+    storage = VectorStorageService(logger=logging.getLogger(__name__), mode=mode)
+    file_path = str(tmp_path / "output.json")
+
+    storage.save_vectors(make_vectors(storage, raw), file_path)
+    loaded = storage.load_vectors(file_path)
+
+    assert [vec["id"] for vec in loaded] == [str(i) for i in range(len(raw))]
+    assert loaded[3]["metadata"] == {"row": "3"}
+    for original, vec in zip(raw, loaded):
+        restored = storage.dequantize(vec["values"], vec.get("scale"))
+        assert len(restored) == len(original)
+        assert 1.0 - cosine(original, restored) < TOLERANCES[mode]
+
+
+def test_int8_zero_vector_uses_unit_scale():
+    storage = VectorStorageService(mode="int8")
+    stored, scale = storage.compress([0.0] * 8)
+
+    assert scale == 1.0
+    assert not stored.any()
+    assert storage.dequantize(stored, scale) == [0.0] * 8
+
+
+@pytest.mark.parametrize("mode", ["float16", "int8"])
+def test_empty_vectors(tmp_path, mode):
+    storage = VectorStorageService(mode=mode)
+    file_path = str(tmp_path / "output.json")
+
+    storage.save_vectors([], file_path)
+
+    assert storage.load_vectors(file_path) == []
+    assert storage.report()["count"] == 0
+
+
+def test_sidecar_row_mismatch(tmp_path):
+    storage = VectorStorageService(mode="float16")
+    file_path = str(tmp_path / "output.json")
+    storage.save_vectors(make_vectors(storage, [[1.0, 2.0], [3.0, 4.0]]), file_path)
+
+    values_path, _ = storage.sidecar_paths(file_path)
+    np.save(values_path, np.zeros((1, 2), dtype=np.float16))
+
+    with pytest.raises(Exception, match="Vector storage mismatch"):
+        storage.load_vectors(file_path)
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        VectorStorageService(mode="bfloat16")
+
+
+def test_report_ignores_stale_sidecars(tmp_path):
+    file_path = str(tmp_path / "output.json")
+    int8_storage = VectorStorageService(mode="int8")
+    int8_storage.save_vectors(make_vectors(int8_storage, [[1.0, 2.0]]), file_path)
+
+    storage = VectorStorageService(mode="float16")
+    _, written = storage.write_arrays(make_vectors(storage, [[1.0, 2.0]]), file_path)
+    values_path, scales_path = storage.sidecar_paths(file_path)
+
+    assert written == [values_path]
+    assert os.path.exists(scales_path)
+    assert storage.report(written)["sidecar_disk_bytes"] == os.path.getsize(values_path)
+
+
+def test_report_estimates_float32_text_size():
+    rng = np.random.default_rng(1)
+    raw = [(rng.normal(size=256) * 0.03).tolist() for _ in range(50)]
+    storage = VectorStorageService(mode="int8")
+    for values in raw:
+        storage.compress(values)
+
+    actual = sum(len(", ".join(map(repr, values))) + len(", ") for values in raw)
+    estimate = storage.report()["float32_text_bytes"]
+    assert abs(estimate - actual) / actual < 0.05